@@ -3,9 +3,26 @@
 # This template shows how to SSH to a device and reboot it
 # Customize for your specific use case
 
-echo "Action triggered at $(date)"
+run_action() {
+    echo "Action triggered at $(date)"
 
-# Example: SSH reboot (uncomment and customize)
-# ssh -o StrictHostKeyChecking=no -o ConnectTimeout=10 root@192.168.11.1 "reboot"
+    # Example: SSH reboot (uncomment and customize)
+    # ssh -n -o StrictHostKeyChecking=no -o ConnectTimeout=10 root@192.168.11.1 "reboot"
 
-echo "Action completed"
+    echo "Action completed"
+}
+
+# With ACTION_SERVE=true the script is started once with --serve and runs
+# the action for each "trigger" line, replying with "status <exit code>".
+# stdin is the trigger pipe, so the action runs with stdin from /dev/null;
+# keep it that way (or use ssh -n) so commands you add can't eat triggers.
+if [ "$1" = "--serve" ]; then
+    while read -r command; do
+        [ "$command" = "trigger" ] || continue
+        run_action </dev/null
+        echo "status $?"
+    done
+    exit 0
+fi
+
+run_action
@@ -1,18 +1,50 @@
 #!/usr/bin/env python3
 """Internet connectivity health checker with failure action."""
 
+import asyncio
+import functools
 import json
 import os
+import re
+import socket
+import struct
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from dataclasses import asdict, dataclass, field
+
+try:
+    import orjson
+except ImportError:  # running outside the image; fall back to the stdlib encoder
+    orjson = None
 
 HEALTH_FILE = "/tmp/health_status"
 ACTION_SCRIPT = "/action.sh"
 LOG_LEVELS = {"debug": 0, "info": 1, "warn": 2, "error": 3}
+FLUSH_LOG_LEVEL = 2  # warn and above are flushed immediately
 _min_log_level = 1  # default to info
+_last_health: bool | None = None
+_log_line_buffered = False
+JSON_SEPARATORS = (",", ":")
+_ts_second = -1
+_ts_prefix = ""
+LOG_CHECK_STARTED = b'{"ts":"%s","level":"debug","event":"check_started","targets":%s}\n'
+LOG_CHECK_RESULT_OK = b'{"ts":"%s","level":"debug","event":"check_result","target":%s,"success":true,"latency_ms":%d}\n'
+LOG_CHECK_RESULT_FAILED = b'{"ts":"%s","level":"warn","event":"check_result","target":%s,"success":false,"error":%s}\n'
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+ICMP_PAYLOAD = b"internet-check"
+ACTION_STATUS_PREFIX = "status "
+_action_proc: subprocess.Popen | None = None
+_icmp_socket = None
+_icmp_unavailable = False
+_icmp_seq = 0
+_icmp_waiters: dict[int, asyncio.Future] = {}
+PING_REPLY_RE = re.compile(rb"time=([\d.]+) ms")
+_ping_streams: dict[str, "PingStream"] = {}
+DNS_REFRESH_CHECKS = 100  # re-resolve target names every N check intervals
 
 
 def set_log_level(level: str):
@@ -21,11 +53,118 @@ def set_log_level(level: str):
     _min_log_level = LOG_LEVELS.get(level.lower(), 1)
 
 
+def configure_log_output():
+    """
+    Log lines are written to stdout's binary buffer so a check cycle's
+    entries go out in one write. Interactive terminals flush every line.
+    """
+    global _log_line_buffered
+    _log_line_buffered = sys.stdout.isatty()
+
+
+def write_log_line(line: bytes, flush: bool = False):
+    """Append an encoded log line to stdout, flushing if asked or on a tty."""
+    sys.stdout.buffer.write(line)
+    if flush or _log_line_buffered:
+        sys.stdout.buffer.flush()
+
+
 def write_health_status(healthy: bool):
-    """Write current health status to file for Docker healthcheck."""
-    status = "healthy" if healthy else "unhealthy"
-    with open(HEALTH_FILE, "w") as f:
-        f.write(status)
+    """Write current health status to file for Docker healthcheck (only on change)."""
+    global _last_health
+    if healthy == _last_health:
+        return
+    # Write a temp file and rename it over the old one so the healthcheck
+    # never reads a truncated file mid-write
+    tmp_path = HEALTH_FILE + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, b"healthy" if healthy else b"unhealthy")
+    finally:
+        os.close(fd)
+    os.rename(tmp_path, HEALTH_FILE)
+    _last_health = healthy
+
+
+def start_action_server():
+    """
+    Start the action script once as a long-lived `--serve` process so each
+    trigger doesn't pay for a fresh fork+exec of the script's interpreter.
+    """
+    global _action_proc
+    try:
+        _action_proc = subprocess.Popen(
+            [ACTION_SCRIPT, "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            bufsize=1,
+        )
+    except OSError as e:
+        log("warn", "action_server_failed", error=str(e), path=ACTION_SCRIPT)
+        return
+    threading.Thread(target=drain_action_stderr, args=(_action_proc,), daemon=True).start()
+    log("info", "action_server_started", pid=_action_proc.pid)
+
+
+def drain_action_stderr(proc: subprocess.Popen):
+    """Log the persistent action process's stderr line by line until it exits."""
+    for line in proc.stderr:
+        line = line.strip()
+        if line:
+            log("warn", "action_stderr", output=line)
+
+
+def stop_action_server():
+    """Kill the persistent action process and forget it."""
+    global _action_proc
+    _action_proc.kill()
+    _action_proc.wait()
+    _action_proc = None
+
+
+def trigger_action_server(start: float) -> tuple[int, int] | None:
+    """
+    Send a trigger to the persistent action process and wait for its
+    `status <code>` line. Returns (exit_code, duration_ms), or None if the
+    trigger could not be delivered (callers then fall back to a one-shot run).
+    Once delivered, the action may have run, so exiting early or replying
+    with a malformed status counts as a failed action rather than a retry.
+    """
+    try:
+        _action_proc.stdin.write("trigger\n")
+    except (OSError, ValueError) as e:
+        log("warn", "action_server_failed", error=str(e))
+        stop_action_server()
+        return None
+
+    output = []
+    error = "action server exited without a status"
+    try:
+        for line in _action_proc.stdout:
+            line = line.rstrip("\n")
+            if not line.startswith(ACTION_STATUS_PREFIX):
+                output.append(line)
+                continue
+            try:
+                exit_code = int(line[len(ACTION_STATUS_PREFIX):])
+            except ValueError:
+                error = f"invalid status line: {line}"
+                break
+            duration_ms = int((time.monotonic() - start) * 1000)
+            log("warn", "action_complete", exit_code=exit_code, duration_ms=duration_ms)
+            if output:
+                log("warn", "action_stdout", output="\n".join(output).strip())
+            return exit_code, duration_ms
+    except Exception as e:
+        error = str(e)
+
+    duration_ms = int((time.monotonic() - start) * 1000)
+    log("error", "action_failed", error=error, output="\n".join(output).strip())
+    stop_action_server()
+    return 1, duration_ms
 
 
 def execute_action() -> tuple[int, int]:
@@ -36,6 +175,11 @@ def execute_action() -> tuple[int, int]:
     log("error", "action_triggered")
     start = time.monotonic()
 
+    if _action_proc is not None:
+        served = trigger_action_server(start)
+        if served is not None:
+            return served
+
     try:
         result = subprocess.run(
             [ACTION_SCRIPT],
@@ -59,133 +203,434 @@ def execute_action() -> tuple[int, int]:
         return 1, duration_ms
 
 
+def log_timestamp() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string with a Z suffix.
+    The seconds prefix is formatted once per wall-clock second and reused.
+    """
+    global _ts_second, _ts_prefix
+    now = time.time()
+    second = int(now)
+    if second != _ts_second:
+        _ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _ts_second = second
+    return f"{_ts_prefix}.{int((now - second) * 1_000_000):06d}Z"
+
+
+if orjson is not None:
+    json_bytes = orjson.dumps
+else:
+    def json_bytes(value) -> bytes:
+        """Serialize a value to compact JSON bytes."""
+        return json.dumps(value, separators=JSON_SEPARATORS).encode()
+
+
 def log(level: str, event: str, **kwargs):
     """Output a structured JSON log entry if level meets threshold."""
-    if LOG_LEVELS.get(level, 1) < _min_log_level:
+    severity = LOG_LEVELS.get(level, 1)
+    if severity < _min_log_level:
         return
     entry = {
-        "ts": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "ts": log_timestamp(),
         "level": level,
         "event": event,
         **kwargs,
     }
-    print(json.dumps(entry), flush=True)
+    write_log_line(json_bytes(entry) + b"\n", flush=severity >= FLUSH_LOG_LEVEL)
 
 
-def ping(target: str, timeout_seconds: int) -> tuple[bool, int | None, str | None]:
+@functools.lru_cache(maxsize=64)
+def json_cached(value: str | tuple[str, ...]) -> bytes:
     """
-    Ping a target and return (success, latency_ms, error).
+    Serialize a target name or tuple of names (as a JSON array), keeping
+    the encoded bytes in a small LRU so per-cycle log lines reuse them.
     """
+    return json_bytes(value)
+
+
+def log_check_started(targets: list[str]):
+    """Fast path for the per-cycle check_started entry using a prebuilt template."""
+    if LOG_LEVELS["debug"] < _min_log_level:
+        return
+    write_log_line(LOG_CHECK_STARTED % (log_timestamp().encode(), json_cached(tuple(targets))))
+
+
+def log_check_result_ok(target: str, latency_ms: int):
+    """Fast path for a successful check_result entry using a prebuilt template."""
+    if LOG_LEVELS["debug"] < _min_log_level:
+        return
+    write_log_line(LOG_CHECK_RESULT_OK % (log_timestamp().encode(), json_cached(target), latency_ms))
+
+
+def log_check_result_failed(target: str, error: str | None):
+    """Fast path for a failed check_result entry using a prebuilt template."""
+    if LOG_LEVELS["warn"] < _min_log_level:
+        return
+    write_log_line(
+        LOG_CHECK_RESULT_FAILED % (log_timestamp().encode(), json_cached(target), json_bytes(error)),
+        flush=True,
+    )
+
+
+def icmp_checksum(data: bytes) -> int:
+    """Compute the RFC 1071 one's-complement checksum of an ICMP message."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def get_icmp_socket() -> socket.socket | None:
+    """
+    Return the shared unprivileged ICMP socket, creating it on first use.
+    Returns None if the kernel refuses (needs CAP_NET_RAW or a matching
+    net.ipv4.ping_group_range) or doesn't support ping sockets at all, in
+    which case callers fall back to /bin/ping.
+    """
+    global _icmp_socket, _icmp_unavailable
+    if _icmp_socket is None and not _icmp_unavailable:
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+        except OSError as e:
+            _icmp_unavailable = True
+            log("warn", "icmp_socket_unavailable", error=str(e), fallback="ping")
+            return None
+        sock.setblocking(False)
+        asyncio.get_running_loop().add_reader(sock, handle_icmp_readable, sock)
+        _icmp_socket = sock
+    return _icmp_socket
+
+
+def handle_icmp_readable(sock: socket.socket):
+    """Drain echo replies from the shared socket and wake the matching waiters."""
+    received_at = time.monotonic()
+    while True:
+        try:
+            reply, _ = sock.recvfrom(1024)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            continue  # queued ICMP error for an earlier send; the waiter times out
+        if len(reply) < 8:
+            continue
+        reply_type, _, _, _, reply_seq = struct.unpack("!BBHHH", reply[:8])
+        if reply_type != ICMP_ECHO_REPLY:
+            continue
+        # Stale replies from earlier timed-out probes have no waiter; drop them
+        waiter = _icmp_waiters.pop(reply_seq, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(received_at)
+
+
+def resolve_target(target: str) -> str | None:
+    """Resolve a target to an IPv4 address, or None if the lookup fails."""
+    try:
+        return socket.getaddrinfo(target, None, family=socket.AF_INET)[0][4][0]
+    except (OSError, UnicodeError) as e:  # UnicodeError for malformed names like "a..b"
+        log("warn", "resolve_failed", target=target, error=str(e))
+        return None
+
+
+async def resolve(target: str) -> str:
+    """Resolve a target to an IPv4 address without blocking the event loop."""
+    infos = await asyncio.get_running_loop().getaddrinfo(target, None, family=socket.AF_INET)
+    return infos[0][4][0]
+
+
+def resolve_targets(targets: tuple[str, ...]) -> list[tuple[str, str | None]]:
+    """Resolve every target once and return a new list of (target, address) pairs."""
+    return [(target, resolve_target(target)) for target in targets]
+
+
+async def refresh_resolved_targets(config: "Config", resolved_targets: list[tuple[str, str | None]]):
+    """
+    Periodically re-resolve target names so long-running containers pick up
+    DNS changes. Updates the resolved_targets pairs in place.
+    """
+    while True:
+        await asyncio.sleep(DNS_REFRESH_CHECKS * config.check_interval_seconds)
+        for i, (target, address) in enumerate(resolved_targets):
+            try:
+                new_address = await resolve(target)
+            except (OSError, UnicodeError) as e:
+                log("warn", "resolve_failed", target=target, error=str(e))
+                continue
+            if new_address != address:
+                log("info", "target_resolved", target=target, address=new_address, previous=address)
+                resolved_targets[i] = (target, new_address)
+                stop_ping_stream(address or target)
+
+
+async def icmp_ping(sock: socket.socket, address: str, timeout_seconds: int) -> tuple[bool, int | None, str | None]:
+    """
+    Send one ICMP echo request over sock and wait for the matching reply.
+    """
+    global _icmp_seq
+    _icmp_seq = (_icmp_seq + 1) & 0xFFFF
+    seq = _icmp_seq
+    ident = os.getpid() & 0xFFFF  # the kernel rewrites this for SOCK_DGRAM sockets
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+    checksum = icmp_checksum(header + ICMP_PAYLOAD)
+    packet = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, checksum, ident, seq) + ICMP_PAYLOAD
+
+    waiter = asyncio.get_running_loop().create_future()
+    _icmp_waiters[seq] = waiter
     start = time.monotonic()
     try:
-        result = subprocess.run(
-            ["ping", "-c", "1", "-W", str(timeout_seconds), target],
-            capture_output=True,
-            text=True,
-            timeout=timeout_seconds + 1,
-        )
-        latency_ms = int((time.monotonic() - start) * 1000)
-        if result.returncode == 0:
-            return True, latency_ms, None
-        else:
-            return False, None, "unreachable"
-    except subprocess.TimeoutExpired:
+        sock.sendto(packet, (address, 0))
+        received_at = await asyncio.wait_for(waiter, timeout_seconds)
+    except asyncio.TimeoutError:
         return False, None, "timeout"
-    except Exception as e:
-        return False, None, str(e)
+    finally:
+        _icmp_waiters.pop(seq, None)
+    return True, int((received_at - start) * 1000), None
 
 
-def check_connectivity(targets: list[str], timeout_seconds: int) -> bool:
+@dataclass
+class PingStream:
+    """State of a long-lived `ping -i INTERVAL` process watching one target."""
+    address: str
+    interval_seconds: int
+    task: asyncio.Task | None = None
+    last_reply: float | None = None
+    latency_ms: int | None = None
+    waiters: list[asyncio.Future] = field(default_factory=list)
+
+
+async def run_ping_stream(stream: PingStream, timeout_seconds: int):
+    """Run /bin/ping for a stream, recording each reply as it is printed."""
+    proc = await asyncio.create_subprocess_exec(
+        "ping", "-n", "-i", str(stream.interval_seconds), "-W", str(timeout_seconds), stream.address,
+        stdout=asyncio.subprocess.PIPE,
+        # One pipe, drained continuously: an unread stderr pipe would fill up
+        # (and stall ping) during a long outage of "Network is unreachable" lines
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    last_output = b""
+    try:
+        async for line in proc.stdout:
+            match = PING_REPLY_RE.search(line)
+            if match is None:
+                if line.strip():
+                    last_output = line
+                continue
+            stream.last_reply = time.monotonic()
+            stream.latency_ms = int(float(match.group(1)))
+            for waiter in stream.waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+            stream.waiters.clear()
+        await proc.wait()
+        log("warn", "ping_stream_exited", address=stream.address, exit_code=proc.returncode,
+            error=last_output.decode(errors="replace").strip())
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+
+def stop_ping_stream(address: str):
+    """Stop the persistent ping stream for an address, if there is one."""
+    stream = _ping_streams.pop(address, None)
+    if stream is not None:
+        stream.task.cancel()
+
+
+async def subprocess_ping(
+    target: str, interval_seconds: int, timeout_seconds: int
+) -> tuple[bool, int | None, str | None]:
     """
-    Ping all targets. Returns True if ANY target is reachable.
+    Check a target via its persistent /bin/ping stream and return
+    (success, latency_ms, error). The stream is (re)started on demand, so
+    ping is forked once per target rather than once per check.
     """
-    log("debug", "check_started", targets=targets)
+    stream = _ping_streams.get(target)
+    if stream is None or stream.task.done():
+        stream = _ping_streams[target] = PingStream(address=target, interval_seconds=interval_seconds)
+        stream.task = asyncio.create_task(run_ping_stream(stream, timeout_seconds))
 
-    any_success = False
-    for target in targets:
-        success, latency_ms, error = ping(target, timeout_seconds)
-        if success:
-            log("debug", "check_result", target=target, success=True, latency_ms=latency_ms)
-            any_success = True
-        else:
-            log("warn", "check_result", target=target, success=False, error=error)
+    # ping replies once per interval; a reply within the last interval counts
+    if stream.last_reply is not None and time.monotonic() - stream.last_reply <= interval_seconds + timeout_seconds:
+        return True, stream.latency_ms, None
 
-    return any_success
+    waiter = asyncio.get_running_loop().create_future()
+    stream.waiters.append(waiter)
+    try:
+        await asyncio.wait({waiter, stream.task}, timeout=timeout_seconds, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        waiter.cancel()
+        if waiter in stream.waiters:
+            stream.waiters.remove(waiter)
+    if waiter.done() and not waiter.cancelled():
+        return True, stream.latency_ms, None
+    if stream.task.cancelled():
+        return False, None, "ping restarted"
+    if stream.task.done():
+        error = stream.task.exception()
+        return False, None, str(error) if error else "ping exited"
+    return False, None, "timeout"
+
+
+async def ping(
+    target: str, address: str | None, interval_seconds: int, timeout_seconds: int
+) -> tuple[bool, int | None, str | None]:
+    """
+    Ping a target and return (success, latency_ms, error).
+    address is the target's pre-resolved IP; None resolves it on the spot.
+    """
+    sock = get_icmp_socket()
+    if sock is None:
+        return await subprocess_ping(address or target, interval_seconds, timeout_seconds)
+    try:
+        return await icmp_ping(sock, address or await resolve(target), timeout_seconds)
+    except socket.gaierror:
+        return False, None, "unresolved"
+    except OSError as e:
+        return False, None, str(e)
 
 
-@dataclass
+async def probe(target: str, address: str | None, interval_seconds: int, timeout_seconds: int) -> bool:
+    """
+    Ping a single target and log the result. Returns True if reachable.
+    """
+    try:
+        success, latency_ms, error = await ping(target, address, interval_seconds, timeout_seconds)
+    except Exception as e:
+        success, latency_ms, error = False, None, str(e)
+    if success:
+        log_check_result_ok(target, latency_ms)
+    else:
+        log_check_result_failed(target, error)
+    return success
+
+
+async def check_connectivity(
+    targets: list[tuple[str, str | None]], interval_seconds: int, timeout_seconds: int
+) -> bool:
+    """
+    Ping all (target, address) pairs concurrently. Returns True as soon as
+    ANY target is reachable, cancelling the probes still in flight.
+    """
+    log_check_started([target for target, _ in targets])
+
+    tasks = {
+        asyncio.create_task(probe(target, address, interval_seconds, timeout_seconds)): target
+        for target, address in targets
+    }
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=timeout_seconds + 1):
+            if await next_done:
+                return True
+    except asyncio.TimeoutError:
+        for task, target in tasks.items():
+            if not task.done():
+                log_check_result_failed(target, "timeout")
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return False
+
+
+@dataclass(slots=True, frozen=True)
 class Config:
-    ping_targets: list[str]
+    ping_targets: tuple[str, ...]
     check_interval_seconds: int
     failure_threshold: int
     cooldown_seconds: int
     ping_timeout_seconds: int
     log_level: str
+    action_serve: bool
 
 
+# Integer settings as (Config field, environment variable, default)
+INT_SETTINGS = (
+    ("check_interval_seconds", "CHECK_INTERVAL_SECONDS", "30"),
+    ("failure_threshold", "FAILURE_THRESHOLD", "3"),
+    ("cooldown_seconds", "COOLDOWN_SECONDS", "300"),
+    ("ping_timeout_seconds", "PING_TIMEOUT_SECONDS", "5"),
+)
+
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load configuration from environment variables."""
-    ping_targets_raw = os.environ.get("PING_TARGETS", "")
+    """Load configuration from environment variables (read once per process)."""
+    env = os.environ
+    ping_targets_raw = env.get("PING_TARGETS", "")
     if not ping_targets_raw:
         log("error", "config_error", message="PING_TARGETS is required")
         sys.exit(1)
 
-    ping_targets = [t.strip() for t in ping_targets_raw.split(",") if t.strip()]
+    if "," not in ping_targets_raw:
+        target = ping_targets_raw.strip()
+        ping_targets = (target,) if target else ()
+    else:
+        ping_targets = tuple(t for t in map(str.strip, ping_targets_raw.split(",")) if t)
     if not ping_targets:
         log("error", "config_error", message="PING_TARGETS must contain at least one target")
         sys.exit(1)
 
+    int_settings = {name: int(env.get(var, default)) for name, var, default in INT_SETTINGS}
+
     return Config(
         ping_targets=ping_targets,
-        check_interval_seconds=int(os.environ.get("CHECK_INTERVAL_SECONDS", "30")),
-        failure_threshold=int(os.environ.get("FAILURE_THRESHOLD", "3")),
-        cooldown_seconds=int(os.environ.get("COOLDOWN_SECONDS", "300")),
-        ping_timeout_seconds=int(os.environ.get("PING_TIMEOUT_SECONDS", "5")),
-        log_level=os.environ.get("LOG_LEVEL", "info"),
+        **int_settings,
+        log_level=env.get("LOG_LEVEL", "info"),
+        action_serve=env.get("ACTION_SERVE", "false").lower() in ("1", "true", "yes"),
     )
 
 
-def main():
+async def main():
+    configure_log_output()
     config = load_config()
     set_log_level(config.log_level)
-    log("info", "startup", config={
-        "ping_targets": config.ping_targets,
-        "check_interval_seconds": config.check_interval_seconds,
-        "failure_threshold": config.failure_threshold,
-        "cooldown_seconds": config.cooldown_seconds,
-        "ping_timeout_seconds": config.ping_timeout_seconds,
-        "log_level": config.log_level,
-    })
+    resolved_targets = resolve_targets(config.ping_targets)
+    log("info", "startup", config=asdict(config), resolved_targets=resolved_targets)
+    if config.action_serve:
+        start_action_server()
 
     failure_count = 0
+    # Keep a reference so the background task isn't garbage collected
+    refresh_task = asyncio.create_task(refresh_resolved_targets(config, resolved_targets))
+    # Checks run on a fixed cadence of absolute deadlines so check time doesn't drift the interval
+    deadline = time.monotonic()
 
     while True:
-        any_reachable = check_connectivity(config.ping_targets, config.ping_timeout_seconds)
+        any_reachable = await check_connectivity(
+            resolved_targets, config.check_interval_seconds, config.ping_timeout_seconds
+        )
 
-        if any_reachable:
-            failure_count = 0
-            write_health_status(healthy=True)
-            log("debug", "check_complete", all_failed=False, failure_count=failure_count)
-        else:
-            failure_count += 1
-            write_health_status(healthy=False)
-            log("error", "check_complete", all_failed=True, failure_count=failure_count)
+        failure_count = 0 if any_reachable else failure_count + 1
+        write_health_status(healthy=any_reachable)
+        log("debug" if any_reachable else "error", "check_complete",
+            all_failed=not any_reachable, failure_count=failure_count)
 
-            if failure_count >= config.failure_threshold:
-                execute_action()
+        if not any_reachable and failure_count >= config.failure_threshold:
+            execute_action()
 
-                # Enter cooldown
-                log("info", "cooldown_started", duration_seconds=config.cooldown_seconds)
-                time.sleep(config.cooldown_seconds)
-                log("info", "cooldown_complete")
+            # Enter cooldown
+            log("info", "cooldown_started", duration_seconds=config.cooldown_seconds)
+            sys.stdout.buffer.flush()
+            await asyncio.sleep(config.cooldown_seconds)
+            log("info", "cooldown_complete")
 
-                # Reset after cooldown
-                failure_count = 0
-                write_health_status(healthy=False)  # Still unhealthy until next successful check
-                continue  # Skip the normal sleep, go straight to next check
+            # Reset after cooldown
+            failure_count = 0
+            write_health_status(healthy=False)  # Still unhealthy until next successful check
+            deadline = time.monotonic()
+            continue  # Skip the normal sleep, go straight to next check
 
-        time.sleep(config.check_interval_seconds)
+        deadline += config.check_interval_seconds
+        now = time.monotonic()
+        if deadline < now:
+            log("warn", "cycle_overrun", overrun_ms=int((now - deadline) * 1000))
+            deadline = now  # run the next check immediately, without a catch-up burst
+        sys.stdout.buffer.flush()
+        await asyncio.sleep(deadline - now)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())